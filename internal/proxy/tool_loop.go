@@ -8,6 +8,7 @@ import (
 	"io"
 	"net/http"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/llamagate/llamagate/internal/middleware"
@@ -198,8 +199,13 @@ func (p *Proxy) executeToolLoop(ctx context.Context, requestID string, model str
 		}
 
 		// Execute tool calls
-		toolMessages := make([]Message, 0, len(assistantMessage.ToolCalls))
-		for _, toolCall := range assistantMessage.ToolCalls {
+		// Guardrail accounting stays sequential so limits behave exactly as
+		// before; approved calls are then executed concurrently since
+		// independent tool calls within one assistant turn have no ordering
+		// dependency (the transports multiplex requests safely)
+		toolMessages := make([]Message, len(assistantMessage.ToolCalls))
+		approvedIndexes := make([]int, 0, len(assistantMessage.ToolCalls))
+		for i, toolCall := range assistantMessage.ToolCalls {
 			// Increment total tool calls counter
 			totalToolCalls++
 
@@ -226,41 +232,70 @@ func (p *Proxy) executeToolLoop(ctx context.Context, requestID string, model str
 					Err(err).
 					Msg("Tool call denied")
 				// Add error message
-				toolMessages = append(toolMessages, Message{
+				toolMessages[i] = Message{
 					Role:       "tool",
 					ToolCallID: toolCall.ID,
 					Content:    fmt.Sprintf(`{"error": "Tool call denied: %s"}`, err.Error()),
-				})
+				}
 				continue
 			}
 
-			// Execute tool
-			result, err := p.executeTool(ctx, requestID, toolCall)
-			if err != nil {
-				log.Error().
-					Str("request_id", requestID).
-					Str("tool", toolCall.Function.Name).
-					Err(err).
-					Msg("Tool execution failed")
-				// Add error message
-				toolMessages = append(toolMessages, Message{
-					Role:       "tool",
-					ToolCallID: toolCall.ID,
-					Content:    fmt.Sprintf(`{"error": "Tool execution failed: %s"}`, err.Error()),
-				})
-				continue
-			}
+			approvedIndexes = append(approvedIndexes, i)
+		}
+
+		// Execute approved tools concurrently, writing each result back to
+		// its original slot so tool messages keep the model's call order
+		var wg sync.WaitGroup
+		for _, i := range approvedIndexes {
+			wg.Add(1)
+			go func(i int, toolCall ToolCall) {
+				defer wg.Done()
+				// Bare goroutines are outside gin.Recovery(), so a panic
+				// here would crash the whole proxy; recover it into the
+				// same error message a failed execution produces
+				defer func() {
+					if r := recover(); r != nil {
+						log.Error().
+							Str("request_id", requestID).
+							Str("tool", toolCall.Function.Name).
+							Interface("panic", r).
+							Msg("Tool execution panicked")
+						toolMessages[i] = Message{
+							Role:       "tool",
+							ToolCallID: toolCall.ID,
+							Content:    fmt.Sprintf(`{"error": "Tool execution failed: %v"}`, r),
+						}
+					}
+				}()
+
+				result, err := p.executeTool(ctx, requestID, toolCall)
+				if err != nil {
+					log.Error().
+						Str("request_id", requestID).
+						Str("tool", toolCall.Function.Name).
+						Err(err).
+						Msg("Tool execution failed")
+					// Add error message
+					toolMessages[i] = Message{
+						Role:       "tool",
+						ToolCallID: toolCall.ID,
+						Content:    fmt.Sprintf(`{"error": "Tool execution failed: %s"}`, err.Error()),
+					}
+					return
+				}
 
-			// Truncate result if needed
-			result = p.guardrails.TruncateResult(result)
+				// Truncate result if needed
+				result = p.guardrails.TruncateResult(result)
 
-			// Add tool result message
-			toolMessages = append(toolMessages, Message{
-				Role:       "tool",
-				ToolCallID: toolCall.ID,
-				Content:    result,
-			})
+				// Add tool result message
+				toolMessages[i] = Message{
+					Role:       "tool",
+					ToolCallID: toolCall.ID,
+					Content:    result,
+				}
+			}(i, assistantMessage.ToolCalls[i])
 		}
+		wg.Wait()
 
 		// Add tool messages to conversation
 		messages = append(messages, toolMessages...)